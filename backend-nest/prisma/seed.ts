@@ -1,7 +1,37 @@
+import { createReadStream, existsSync, readFileSync } from 'fs';
+import { join, resolve } from 'path';
+import { createInterface } from 'readline';
 import { PrismaClient, utilisateur_statut } from '@prisma/client';
 
 const prisma = new PrismaClient();
 
+// NDJSON streams written by script/build_seed_responsables.py
+const NDJSON_DIR = process.env.SEED_NDJSON_DIR ?? resolve(__dirname, '../../script/db/ndjson');
+
+interface NdjsonManifest {
+  batch_rows: number;
+  tables: { table: string; file: string; rows: number; batches: number }[];
+}
+
+type NdjsonRow = Record<string, unknown>;
+
+interface CreateManyDelegate {
+  createMany(args: { data: NdjsonRow[]; skipDuplicates?: boolean }): Promise<{ count: number }>;
+}
+
+const ndjsonDelegates: Record<string, CreateManyDelegate> = {
+  role: prisma.role,
+  entite_structure: prisma.entite_structure,
+  composante: prisma.composante,
+  departement: prisma.departement,
+  mention: prisma.mention,
+  parcours: prisma.parcours,
+  niveau: prisma.niveau,
+  utilisateur: prisma.utilisateur,
+  affectation: prisma.affectation,
+  contact_role: prisma.contact_role,
+} as unknown as Record<string, CreateManyDelegate>;
+
 interface SeedUser {
   login: string;
   nom: string;
@@ -66,6 +96,71 @@ async function ensureUser(user: SeedUser, anneeId: bigint): Promise<void> {
   }
 }
 
+function toPrismaRow(row: NdjsonRow): NdjsonRow {
+  const data: NdjsonRow = {};
+  for (const [key, value] of Object.entries(row)) {
+    if (key.startsWith('id_') && typeof value === 'number') {
+      data[key] = BigInt(value);
+    } else if (key.startsWith('date_') && typeof value === 'string') {
+      data[key] = new Date(value);
+    } else {
+      data[key] = value;
+    }
+  }
+  return data;
+}
+
+async function seedNdjsonTable(dir: string, entry: NdjsonManifest['tables'][number], batchRows: number): Promise<void> {
+  const delegate = ndjsonDelegates[entry.table];
+  if (!delegate) {
+    throw new Error(`Unknown NDJSON table: ${entry.table}`);
+  }
+
+  const lines = createInterface({ input: createReadStream(join(dir, entry.file)), crlfDelay: Infinity });
+  let batch: NdjsonRow[] = [];
+  let rows = 0;
+  for await (const line of lines) {
+    if (!line) {
+      continue;
+    }
+    batch.push(toPrismaRow(JSON.parse(line) as NdjsonRow));
+    if (batch.length === batchRows) {
+      await delegate.createMany({ data: batch, skipDuplicates: true });
+      rows += batch.length;
+      batch = [];
+    }
+  }
+  if (batch.length) {
+    await delegate.createMany({ data: batch, skipDuplicates: true });
+    rows += batch.length;
+  }
+
+  if (rows !== entry.rows) {
+    throw new Error(`${entry.file}: expected ${entry.rows} rows, read ${rows}.`);
+  }
+}
+
+async function seedFromNdjson(dir: string): Promise<void> {
+  const manifest = JSON.parse(readFileSync(join(dir, 'manifest.json'), 'utf-8')) as NdjsonManifest;
+  // tables are listed in foreign-key order
+  for (const entry of manifest.tables) {
+    await seedNdjsonTable(dir, entry, manifest.batch_rows);
+  }
+
+  await prisma.$executeRawUnsafe(
+    "select setval(pg_get_serial_sequence('entite_structure','id_entite'), (select max(id_entite) from entite_structure))",
+  );
+  await prisma.$executeRawUnsafe(
+    "select setval(pg_get_serial_sequence('utilisateur','id_user'), (select max(id_user) from utilisateur))",
+  );
+  await prisma.$executeRawUnsafe(
+    "select setval(pg_get_serial_sequence('affectation','id_affectation'), (select max(id_affectation) from affectation))",
+  );
+  await prisma.$executeRawUnsafe(
+    "select setval(pg_get_serial_sequence('contact_role','id_contact_role'), (select max(id_contact_role) from contact_role))",
+  );
+}
+
 async function main() {
   const year = await prisma.annee_universitaire.findFirst({
     where: { statut: 'EN_COURS' },
@@ -76,6 +171,10 @@ async function main() {
     throw new Error('No active academic year found to seed mock users.');
   }
 
+  if (existsSync(join(NDJSON_DIR, 'manifest.json'))) {
+    await seedFromNdjson(NDJSON_DIR);
+  }
+
   await ensureRole({
     id: 'lecture-seule',
     libelle: 'Lecture seule',
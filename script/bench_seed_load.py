@@ -0,0 +1,144 @@
+import argparse
+import json
+import sqlite3
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+
+from bench_seed_render import AFF_HEADER, USER_HEADER, make_rows
+from ndjson_export import BATCH_ROWS, MANIFEST_NAME, write_ndjson_tables
+from sql_render import escape_column, nullable_column, write_insert
+
+# Benchmark of the two seed paths of build_seed_responsables.py on a local
+# database stand-in (in-memory SQLite): replaying the SQL file vs ingesting the
+# NDJSON streams batch by batch, as prisma/seed.ts does with createMany.
+
+SCHEMA = '''
+create table utilisateur (
+  id_user integer primary key, login text not null unique, nom text not null, prenom text not null,
+  email_institutionnel text, telephone text, bureau text, statut text not null
+);
+create table affectation (
+  id_affectation integer primary key, id_user integer not null references utilisateur (id_user),
+  id_role text not null, id_entite integer not null, id_annee integer not null,
+  date_debut text not null, date_fin text,
+  unique (id_user, id_role, id_entite, id_annee)
+);
+'''
+
+
+def write_inputs(tmp_dir, users, affectations, batch_rows):
+    sql_path = tmp_dir / 'seed.sql'
+    with open(sql_path, 'w', encoding='utf-8') as out:
+        write_insert(
+            out,
+            USER_HEADER,
+            "  (%d, '%s', '%s', '%s', %s, %s, %s, 'ACTIF')",
+            [
+                [u['id'] for u in users],
+                escape_column(u['login'] for u in users),
+                escape_column(u['nom'] for u in users),
+                escape_column(u['prenom'] for u in users),
+                nullable_column(u['email'] for u in users),
+                nullable_column(u['telephone'] for u in users),
+                nullable_column(u['bureau'] for u in users),
+            ],
+        )
+        write_insert(
+            out,
+            AFF_HEADER,
+            "  (%d, %d, '%s', %d, %d, '%s', null)",
+            [
+                range(2000, 2000 + len(affectations)),
+                [a['user_id'] for a in affectations],
+                escape_column(a['role_id'] for a in affectations),
+                [a['entite_id'] for a in affectations],
+                [a['annee_id'] for a in affectations],
+                escape_column(a['date_debut'] for a in affectations),
+            ],
+        )
+
+    ndjson_dir = tmp_dir / 'ndjson'
+    write_ndjson_tables(ndjson_dir, [
+        ('utilisateur', ({
+            'id_user': u['id'],
+            'login': u['login'],
+            'nom': u['nom'],
+            'prenom': u['prenom'],
+            'email_institutionnel': u['email'],
+            'telephone': u['telephone'],
+            'bureau': u['bureau'],
+            'statut': 'ACTIF',
+        } for u in users)),
+        ('affectation', ({
+            'id_affectation': aff_id,
+            'id_user': a['user_id'],
+            'id_role': a['role_id'],
+            'id_entite': a['entite_id'],
+            'id_annee': a['annee_id'],
+            'date_debut': a['date_debut'],
+            'date_fin': None,
+        } for aff_id, a in enumerate(affectations, start=2000))),
+    ], batch_rows)
+    return sql_path, ndjson_dir
+
+
+def load_sql(db, sql_path):
+    db.executescript(sql_path.read_text(encoding='utf-8'))
+
+
+def load_ndjson(db, ndjson_dir):
+    manifest = json.loads((ndjson_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+    batch_rows = manifest['batch_rows']
+    for entry in manifest['tables']:
+        with open(ndjson_dir / entry['file'], encoding='utf-8') as f:
+            rows = map(json.loads, f)
+            first = next(rows, None)
+            if first is None:
+                continue
+            columns = list(first)
+            insert = 'insert into {} ({}) values ({})'.format(
+                entry['table'], ', '.join(columns), ', '.join(':' + c for c in columns)
+            )
+            batch = [first] + list(islice(rows, batch_rows - 1))
+            while batch:
+                with db:
+                    db.executemany(insert, batch)
+                batch = list(islice(rows, batch_rows))
+
+
+def best_time(fn, source, expected_rows, repeat):
+    best = None
+    for _ in range(repeat):
+        db = sqlite3.connect(':memory:')
+        db.executescript(SCHEMA)
+        start = time.perf_counter()
+        fn(db, source)
+        elapsed = time.perf_counter() - start
+        loaded = sum(db.execute(f"select count(*) from {t}").fetchone()[0] for t in ['utilisateur', 'affectation'])
+        db.close()
+        if loaded != expected_rows:
+            raise SystemExit(f"{fn.__name__}: {loaded} lignes chargees au lieu de {expected_rows}")
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark du chargement du seed responsables : SQL vs NDJSON')
+    parser.add_argument('--rows', type=int, default=200_000, help='utilisateurs et affectations generes')
+    parser.add_argument('--batch-rows', type=int, default=BATCH_ROWS)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    users, affectations = make_rows(args.rows)
+    total = len(users) + len(affectations)
+    with tempfile.TemporaryDirectory() as tmp:
+        sql_path, ndjson_dir = write_inputs(Path(tmp), users, affectations, args.batch_rows)
+        for label, fn, source in [('sql', load_sql, sql_path), ('ndjson', load_ndjson, ndjson_dir)]:
+            elapsed = best_time(fn, source, total, args.repeat)
+            print(f"{label:7} {total} rows in {elapsed:.3f}s -> {total / elapsed:,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
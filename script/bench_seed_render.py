@@ -0,0 +1,132 @@
+import argparse
+import io
+import time
+
+from sql_render import escape_column, nullable_column, write_insert
+
+# Benchmark of the SQL render phase of build_seed_responsables.py:
+# per-row formatting (previous writer) vs batch column rendering (sql_render.py).
+# Both outputs are compared byte for byte before timings are printed.
+
+YEAR_ID = 3
+DATE_DEBUT = '2025-09-01'
+
+USER_HEADER = 'insert into utilisateur (id_user, login, nom, prenom, email_institutionnel, telephone, bureau, statut) values'
+AFF_HEADER = 'insert into affectation (id_affectation, id_user, id_role, id_entite, id_annee, date_debut, date_fin) values'
+
+
+def make_rows(n):
+    users = []
+    for i in range(n):
+        users.append({
+            'id': 1000 + i,
+            'login': f"prenom.nom{i}",
+            'nom': f"D'ARTOIS {i}" if i % 7 == 0 else f"NOM {i}",
+            'prenom': 'Jean-Marie',
+            'email': None if i % 5 == 0 else f"user{i}@univ-paris13.fr",
+            'telephone': None if i % 3 == 0 else '01 49 40 00 00',
+            'bureau': None if i % 2 == 0 else f"B{i % 400}",
+        })
+    affectations = [{
+        'user_id': 1000 + i,
+        'role_id': 'responsable-formation' if i % 2 else 'role-directeur-d-etudes-l3',
+        'entite_id': 1000 + i % 90,
+        'annee_id': YEAR_ID,
+        'date_debut': DATE_DEBUT,
+    } for i in range(n)]
+    return users, affectations
+
+
+def render_per_row(users, affectations):
+    lines = []
+    lines.append(USER_HEADER)
+    vals = []
+    for u in users:
+        vals.append(
+            "  ({id}, '{login}', '{nom}', '{prenom}', {email}, {tel}, {bureau}, 'ACTIF')".format(
+                id=u['id'],
+                login=u['login'].replace("'", "''"),
+                nom=u['nom'].replace("'", "''"),
+                prenom=u['prenom'].replace("'", "''"),
+                email=('null' if not u['email'] else "'{}'".format(u['email'].replace("'", "''"))),
+                tel=('null' if not u['telephone'] else "'{}'".format(u['telephone'].replace("'", "''"))),
+                bureau=('null' if not u['bureau'] else "'{}'".format(u['bureau'].replace("'", "''"))),
+            )
+        )
+    lines.append(',\n'.join(vals) + ';')
+    lines.append('')
+    lines.append(AFF_HEADER)
+    vals = []
+    next_aff_id = 2000
+    for a in affectations:
+        aff_id = next_aff_id
+        next_aff_id += 1
+        vals.append(
+            f"  ({aff_id}, {a['user_id']}, '{a['role_id']}', {a['entite_id']}, {a['annee_id']}, '{a['date_debut']}', null)"
+        )
+    lines.append(',\n'.join(vals) + ';')
+    lines.append('')
+    # trailing "\n" stands for the join with the next statement of the file
+    return "\n".join(lines) + "\n"
+
+
+def render_batch(users, affectations):
+    out = io.StringIO()
+    write_insert(
+        out,
+        USER_HEADER,
+        "  (%d, '%s', '%s', '%s', %s, %s, %s, 'ACTIF')",
+        [
+            [u['id'] for u in users],
+            escape_column(u['login'] for u in users),
+            escape_column(u['nom'] for u in users),
+            escape_column(u['prenom'] for u in users),
+            nullable_column(u['email'] for u in users),
+            nullable_column(u['telephone'] for u in users),
+            nullable_column(u['bureau'] for u in users),
+        ],
+    )
+    write_insert(
+        out,
+        AFF_HEADER,
+        "  (%d, %d, '%s', %d, %d, '%s', null)",
+        [
+            range(2000, 2000 + len(affectations)),
+            [a['user_id'] for a in affectations],
+            escape_column(a['role_id'] for a in affectations),
+            [a['entite_id'] for a in affectations],
+            [a['annee_id'] for a in affectations],
+            escape_column(a['date_debut'] for a in affectations),
+        ],
+    )
+    return out.getvalue()
+
+
+def best_time(fn, users, affectations, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(users, affectations)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark du rendu SQL du seed responsables')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='utilisateurs et affectations generes')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    users, affectations = make_rows(args.rows)
+    if render_per_row(users, affectations) != render_batch(users, affectations):
+        raise SystemExit('Sorties differentes entre le rendu ligne a ligne et le rendu par colonnes')
+
+    total = len(users) + len(affectations)
+    for label, fn in [('per-row', render_per_row), ('batch', render_batch)]:
+        elapsed = best_time(fn, users, affectations, args.repeat)
+        print(f"{label:8} {total} rows in {elapsed:.3f}s -> {total / elapsed:,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
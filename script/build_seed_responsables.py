@@ -5,10 +5,14 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from collections import defaultdict
 
+from ndjson_export import write_ndjson_tables
+from sql_render import escape_column, nullable_column, nullable_int_column, write_insert, write_lines
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 XLSX_PATH = BASE_DIR / 'files' / 'donnee_responsable' / 'Responsables Licence 2025-26.xlsx'
 CSV_PATH = BASE_DIR / 'files' / 'donnee_responsable' / 'formations_responsables.csv'
 OUT_SQL = BASE_DIR / 'script' / 'db' / 'init' / '004_seed_responsables.sql'
+OUT_NDJSON = BASE_DIR / 'script' / 'db' / 'ndjson'
 
 YEAR_ID = 3  # 2025-2026
 DATE_DEBUT = '2025-09-01'
@@ -544,137 +548,182 @@ for a in affectations:
 # map affectation key to temp id
 
 # --- Write SQL
-lines = []
-lines.append('-- Seed responsables reelles (CSV + XLSX)')
-lines.append('-- Genere automatiquement par script/build_seed_responsables.py')
-lines.append('')
-
-# roles
-if role_rows:
-    lines.append('insert into role (id_role, libelle, description, niveau_hierarchique, is_global) values')
-    vals = []
-    for role_id, label in role_rows:
-        vals.append(f"  ('{role_id}', '{label.replace("'", "''")}', 'Import CSV/XLSX', 10, true)")
-    lines.append(',\n'.join(vals) + ';')
-    lines.append('')
-
-# entite_structure
-lines.append('insert into entite_structure (id_entite, id_annee, id_entite_parent, type_entite, nom) values')
-vals = []
+# Columns are escaped in batch and streamed to the file in chunks (see sql_render.py)
+
+# affectation ids
+aff_ids = list(range(2000, 2000 + len(uniq_affectations)))
+aff_key_to_id = {
+    (a['user_id'], a['role_id'], a['entite_id'], a['annee_id']): aff_id
+    for a, aff_id in zip(uniq_affectations, aff_ids)
+}
+
+# contact_role rows (skipped when the affectation is unknown)
+contact_rows = [(aff_key_to_id.get(cr['aff_key']), cr) for cr in contact_roles]
+contact_rows = [(aff_id, cr) for aff_id, cr in contact_rows if aff_id]
+
+# entite_structure rows, parents before children
+ordered_entites = []
 for type_entite in ['COMPOSANTE','DEPARTEMENT','MENTION','PARCOURS','NIVEAU']:
-    for ent_id, name, parent_id in sorted(entites_by_type[type_entite], key=lambda x: x[0]):
-        parent_val = 'null' if parent_id is None else str(parent_id)
-        vals.append(f"  ({ent_id}, {YEAR_ID}, {parent_val}, '{type_entite}', '{name.replace("'", "''")}')")
-lines.append(',\n'.join(vals) + ';')
-lines.append('')
-
-# specialized tables
-if entites_by_type['COMPOSANTE']:
-    lines.append('insert into composante (id_entite, site_web) values')
-    vals = []
-    for ent_id, name, _ in sorted(entites_by_type['COMPOSANTE'], key=lambda x: x[0]):
-        vals.append(f"  ({ent_id}, null)")
-    lines.append(',\n'.join(vals) + ';')
-    lines.append('')
-
-if entites_by_type['DEPARTEMENT']:
-    lines.append('insert into departement (id_entite, code_interne) values')
-    vals = []
-    for ent_id, name, _ in sorted(entites_by_type['DEPARTEMENT'], key=lambda x: x[0]):
-        vals.append(f"  ({ent_id}, null)")
-    lines.append(',\n'.join(vals) + ';')
-    lines.append('')
-
-if entites_by_type['MENTION']:
-    lines.append('insert into mention (id_entite, type_diplome) values')
-    vals = []
-    for ent_id, name, _ in sorted(entites_by_type['MENTION'], key=lambda x: x[0]):
-        vals.append(f"  ({ent_id}, null)")
-    lines.append(',\n'.join(vals) + ';')
-    lines.append('')
-
-if entites_by_type['PARCOURS']:
-    lines.append('insert into parcours (id_entite, code_parcours) values')
-    vals = []
-    for ent_id, name, _ in sorted(entites_by_type['PARCOURS'], key=lambda x: x[0]):
-        vals.append(f"  ({ent_id}, null)")
-    lines.append(',\n'.join(vals) + ';')
-    lines.append('')
-
-if entites_by_type['NIVEAU']:
-    lines.append('insert into niveau (id_entite, libelle_court) values')
-    vals = []
-    for ent_id, name, _ in sorted(entites_by_type['NIVEAU'], key=lambda x: x[0]):
-        vals.append(f"  ({ent_id}, null)")
-    lines.append(',\n'.join(vals) + ';')
-    lines.append('')
-
-# utilisateurs
-lines.append('insert into utilisateur (id_user, login, nom, prenom, email_institutionnel, telephone, bureau, statut) values')
-vals = []
-for uid in sorted(user_ids):
-    u = user_ids[uid]
-    vals.append(
-        "  ({id}, '{login}', '{nom}', '{prenom}', {email}, {tel}, {bureau}, 'ACTIF')".format(
-            id=uid,
-            login=u['login'].replace("'", "''"),
-            nom=u['nom'].replace("'", "''"),
-            prenom=u['prenom'].replace("'", "''"),
-            email=('null' if not u['email'] else "'{}'".format(u['email'].replace("'", "''"))),
-            tel=('null' if not u['telephone'] else "'{}'".format(u['telephone'].replace("'", "''"))),
-            bureau=('null' if not u['bureau'] else "'{}'".format(u['bureau'].replace("'", "''"))),
+    ordered_entites.extend(
+        (ent_id, name, parent_id, type_entite)
+        for ent_id, name, parent_id in sorted(entites_by_type[type_entite], key=lambda x: x[0])
+    )
+
+ordered_users = [user_ids[uid] for uid in sorted(user_ids)]
+
+with open(OUT_SQL, 'w', encoding='utf-8') as out:
+    write_lines(out, [
+        '-- Seed responsables reelles (CSV + XLSX)',
+        '-- Genere automatiquement par script/build_seed_responsables.py',
+        '',
+    ])
+
+    # roles
+    if role_rows:
+        write_insert(
+            out,
+            'insert into role (id_role, libelle, description, niveau_hierarchique, is_global) values',
+            "  ('%s', '%s', 'Import CSV/XLSX', 10, true)",
+            [escape_column(r[0] for r in role_rows), escape_column(r[1] for r in role_rows)],
         )
+
+    # entite_structure
+    write_insert(
+        out,
+        'insert into entite_structure (id_entite, id_annee, id_entite_parent, type_entite, nom) values',
+        "  (%%d, %d, %%s, '%%s', '%%s')" % YEAR_ID,
+        [
+            [e[0] for e in ordered_entites],
+            nullable_int_column(e[2] for e in ordered_entites),
+            escape_column(e[3] for e in ordered_entites),
+            escape_column(e[1] for e in ordered_entites),
+        ],
     )
-lines.append(',\n'.join(vals) + ';')
-lines.append('')
-
-# affectations
-lines.append('insert into affectation (id_affectation, id_user, id_role, id_entite, id_annee, date_debut, date_fin) values')
-vals = []
-next_aff_id = 2000
-aff_key_to_id = {}
-for a in uniq_affectations:
-    aff_id = next_aff_id
-    next_aff_id += 1
-    key = (a['user_id'], a['role_id'], a['entite_id'], a['annee_id'])
-    aff_key_to_id[key] = aff_id
-    vals.append(
-        f"  ({aff_id}, {a['user_id']}, '{a['role_id']}', {a['entite_id']}, {a['annee_id']}, '{a['date_debut']}', null)"
+
+    # specialized tables
+    for type_entite, header in [
+        ('COMPOSANTE', 'insert into composante (id_entite, site_web) values'),
+        ('DEPARTEMENT', 'insert into departement (id_entite, code_interne) values'),
+        ('MENTION', 'insert into mention (id_entite, type_diplome) values'),
+        ('PARCOURS', 'insert into parcours (id_entite, code_parcours) values'),
+        ('NIVEAU', 'insert into niveau (id_entite, libelle_court) values'),
+    ]:
+        if entites_by_type[type_entite]:
+            write_insert(out, header, '  (%d, null)', [sorted(e[0] for e in entites_by_type[type_entite])])
+
+    # utilisateurs
+    write_insert(
+        out,
+        'insert into utilisateur (id_user, login, nom, prenom, email_institutionnel, telephone, bureau, statut) values',
+        "  (%d, '%s', '%s', '%s', %s, %s, %s, 'ACTIF')",
+        [
+            [u['id'] for u in ordered_users],
+            escape_column(u['login'] for u in ordered_users),
+            escape_column(u['nom'] for u in ordered_users),
+            escape_column(u['prenom'] for u in ordered_users),
+            nullable_column(u['email'] for u in ordered_users),
+            nullable_column(u['telephone'] for u in ordered_users),
+            nullable_column(u['bureau'] for u in ordered_users),
+        ],
+    )
+
+    # affectations
+    write_insert(
+        out,
+        'insert into affectation (id_affectation, id_user, id_role, id_entite, id_annee, date_debut, date_fin) values',
+        "  (%d, %d, '%s', %d, %d, '%s', null)",
+        [
+            aff_ids,
+            [a['user_id'] for a in uniq_affectations],
+            escape_column(a['role_id'] for a in uniq_affectations),
+            [a['entite_id'] for a in uniq_affectations],
+            [a['annee_id'] for a in uniq_affectations],
+            escape_column(a['date_debut'] for a in uniq_affectations),
+        ],
     )
-lines.append(',\n'.join(vals) + ';')
-lines.append('')
-
-# contact_role
-if contact_roles:
-    lines.append('insert into contact_role (id_contact_role, id_affectation, email_fonctionnelle, type_email) values')
-    vals = []
-    next_contact_id = 3000
-    for cr in contact_roles:
-        aff_id = aff_key_to_id.get(cr['aff_key'])
-        if not aff_id:
-            continue
-        vals.append(
-            "  ({id}, {aff}, '{email}', '{typ}')".format(
-                id=next_contact_id,
-                aff=aff_id,
-                email=cr['email'].replace("'", "''"),
-                typ=cr['type_email']
-            )
-        )
-        next_contact_id += 1
-    lines.append(',\n'.join(vals) + ';')
-    lines.append('')
 
-# reset sequences
-lines.append('-- Recalage des sequences')
-lines.append("select setval(pg_get_serial_sequence('entite_structure','id_entite'), (select max(id_entite) from entite_structure));")
-lines.append("select setval(pg_get_serial_sequence('utilisateur','id_user'), (select max(id_user) from utilisateur));")
-lines.append("select setval(pg_get_serial_sequence('affectation','id_affectation'), (select max(id_affectation) from affectation));")
-lines.append("select setval(pg_get_serial_sequence('contact_role','id_contact_role'), (select max(id_contact_role) from contact_role));")
+    # contact_role
+    if contact_roles:
+        write_insert(
+            out,
+            'insert into contact_role (id_contact_role, id_affectation, email_fonctionnelle, type_email) values',
+            "  (%d, %d, '%s', '%s')",
+            [
+                range(3000, 3000 + len(contact_rows)),
+                [aff_id for aff_id, _ in contact_rows],
+                escape_column(cr['email'] for _, cr in contact_rows),
+                escape_column(cr['type_email'] for _, cr in contact_rows),
+            ],
+        )
 
-OUT_SQL.write_text("\n".join(lines), encoding='utf-8')
+    # reset sequences
+    out.write("\n".join([
+        '-- Recalage des sequences',
+        "select setval(pg_get_serial_sequence('entite_structure','id_entite'), (select max(id_entite) from entite_structure));",
+        "select setval(pg_get_serial_sequence('utilisateur','id_user'), (select max(id_user) from utilisateur));",
+        "select setval(pg_get_serial_sequence('affectation','id_affectation'), (select max(id_affectation) from affectation));",
+        "select setval(pg_get_serial_sequence('contact_role','id_contact_role'), (select max(id_contact_role) from contact_role));",
+    ]))
+
+# --- Write NDJSON (same rows, one file per table in foreign-key order, for prisma/seed.ts)
+ndjson_tables = [
+    ('role', ({
+        'id_role': role_id,
+        'libelle': label,
+        'description': 'Import CSV/XLSX',
+        'niveau_hierarchique': 10,
+        'is_global': True,
+    } for role_id, label in role_rows)),
+    ('entite_structure', ({
+        'id_entite': ent_id,
+        'id_annee': YEAR_ID,
+        'id_entite_parent': parent_id,
+        'type_entite': type_entite,
+        'nom': name,
+    } for ent_id, name, parent_id, type_entite in ordered_entites)),
+]
+for type_entite, table, column in [
+    ('COMPOSANTE', 'composante', 'site_web'),
+    ('DEPARTEMENT', 'departement', 'code_interne'),
+    ('MENTION', 'mention', 'type_diplome'),
+    ('PARCOURS', 'parcours', 'code_parcours'),
+    ('NIVEAU', 'niveau', 'libelle_court'),
+]:
+    ndjson_tables.append((table, (
+        {'id_entite': ent_id, column: None}
+        for ent_id in sorted(e[0] for e in entites_by_type[type_entite])
+    )))
+ndjson_tables += [
+    ('utilisateur', ({
+        'id_user': u['id'],
+        'login': u['login'],
+        'nom': u['nom'],
+        'prenom': u['prenom'],
+        'email_institutionnel': u['email'] or None,
+        'telephone': u['telephone'] or None,
+        'bureau': u['bureau'] or None,
+        'statut': 'ACTIF',
+    } for u in ordered_users)),
+    ('affectation', ({
+        'id_affectation': aff_id,
+        'id_user': a['user_id'],
+        'id_role': a['role_id'],
+        'id_entite': a['entite_id'],
+        'id_annee': a['annee_id'],
+        'date_debut': a['date_debut'],
+        'date_fin': None,
+    } for a, aff_id in zip(uniq_affectations, aff_ids))),
+    ('contact_role', ({
+        'id_contact_role': contact_id,
+        'id_affectation': aff_id,
+        'email_fonctionnelle': cr['email'],
+        'type_email': cr['type_email'],
+    } for contact_id, (aff_id, cr) in enumerate(contact_rows, start=3000))),
+]
+write_ndjson_tables(OUT_NDJSON, ndjson_tables)
 
 print('Wrote', OUT_SQL)
+print('Wrote', OUT_NDJSON)
 print('Entities:', len(entite_ids))
 print('Users:', len(user_ids))
 print('Affectations:', len(uniq_affectations))
@@ -0,0 +1,44 @@
+import json
+from itertools import islice
+
+# Rows per createMany batch on the Prisma side; batch k covers lines [k*B, (k+1)*B)
+BATCH_ROWS = 1000
+
+MANIFEST_NAME = 'manifest.json'
+
+# --- Writer
+
+
+def write_ndjson_table(path, rows, batch_rows=BATCH_ROWS):
+    # one JSON object per line, written one batch at a time; returns the row count
+    rows = iter(rows)
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as out:
+        while True:
+            batch = list(islice(rows, batch_rows))
+            if not batch:
+                break
+            out.write('\n'.join(map(encode, batch)))
+            out.write('\n')
+            count += len(batch)
+    return count
+
+
+def write_ndjson_tables(out_dir, tables, batch_rows=BATCH_ROWS):
+    # tables: [(table_name, rows)] already in foreign-key order
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob('*.ndjson'):
+        stale.unlink()
+    manifest = {'batch_rows': batch_rows, 'tables': []}
+    for position, (table, rows) in enumerate(tables, start=1):
+        file_name = f"{position:02d}_{table}.ndjson"
+        count = write_ndjson_table(out_dir / file_name, rows, batch_rows)
+        manifest['tables'].append({
+            'table': table,
+            'file': file_name,
+            'rows': count,
+            'batches': -(-count // batch_rows),
+        })
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + '\n', encoding='utf-8')
+    return manifest
@@ -0,0 +1,61 @@
+from itertools import chain, islice
+
+# Rows rendered per write() call when streaming an insert statement
+CHUNK_ROWS = 5000
+
+# Sentinel used to escape a whole column in one pass (never present in seed data)
+_SEP = '\x00'
+
+# --- Column helpers
+
+
+def escape_column(values):
+    # escape quotes for a whole column at once: join, replace, split
+    values = list(values)
+    if not values:
+        return []
+    joined = _SEP.join(values)
+    if "'" not in joined:
+        return values
+    if joined.count(_SEP) != len(values) - 1:
+        # sentinel collides with the data: fall back to per-value escaping
+        return [v.replace("'", "''") for v in values]
+    return joined.replace("'", "''").split(_SEP)
+
+
+def nullable_column(values):
+    # empty / None -> null, otherwise a quoted and escaped literal
+    return ["'" + v + "'" if v else 'null' for v in escape_column(v or '' for v in values)]
+
+
+def nullable_int_column(values):
+    return ['null' if v is None else str(v) for v in values]
+
+# --- Writer
+
+
+def write_lines(out, lines):
+    for line in lines:
+        out.write(line)
+        out.write('\n')
+
+
+def write_insert(out, header, template, columns, chunk_rows=CHUNK_ROWS):
+    # header, then rows formatted with `template` in chunks, then a blank line;
+    # each chunk is rendered by a single % call on a repeated template
+    out.write(header)
+    out.write('\n')
+    values = chain.from_iterable(zip(*columns))
+    width = len(columns)
+    chunk_template = ',\n'.join([template] * chunk_rows)
+    sep = ''
+    while True:
+        chunk = tuple(islice(values, chunk_rows * width))
+        if not chunk:
+            break
+        if len(chunk) < chunk_rows * width:
+            chunk_template = ',\n'.join([template] * (len(chunk) // width))
+        out.write(sep)
+        out.write(chunk_template % chunk)
+        sep = ',\n'
+    out.write(';\n\n')